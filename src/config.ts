@@ -4,6 +4,8 @@ export interface RuntimeConfig {
   deepseekApiKey: string;
   deepseekBaseUrl: string;
   deepseekRequestTimeoutMs: number;
+  deepseekMaxRetries: number;
+  deepseekModelsCacheTtlMs: number;
   defaultModel: string;
   enableReasonerFallback: boolean;
   fallbackModel: string;
@@ -29,6 +31,8 @@ export function loadRuntimeConfig(env: NodeJS.ProcessEnv = process.env): Runtime
     deepseekApiKey,
     deepseekBaseUrl: env.DEEPSEEK_BASE_URL ?? "https://api.deepseek.com",
     deepseekRequestTimeoutMs: parsePositiveInt(env.DEEPSEEK_REQUEST_TIMEOUT_MS, 120000),
+    deepseekMaxRetries: parseNonNegativeInt(env.DEEPSEEK_MAX_RETRIES, 3),
+    deepseekModelsCacheTtlMs: parseNonNegativeInt(env.DEEPSEEK_MODELS_CACHE_TTL_MS, 60000),
     defaultModel: env.DEEPSEEK_DEFAULT_MODEL ?? "deepseek-chat",
     enableReasonerFallback: parseBoolean(env.DEEPSEEK_ENABLE_REASONER_FALLBACK, true),
     fallbackModel: env.DEEPSEEK_FALLBACK_MODEL ?? "deepseek-chat",
@@ -72,6 +76,19 @@ function parsePositiveInt(value: string | undefined, fallback: number): number {
   return parsed;
 }
 
+function parseNonNegativeInt(value: string | undefined, fallback: number): number {
+  if (!value) {
+    return fallback;
+  }
+
+  const parsed = Number.parseInt(value, 10);
+  if (!Number.isFinite(parsed) || parsed < 0) {
+    return fallback;
+  }
+
+  return parsed;
+}
+
 function parsePort(value: string | undefined, fallback: number): number {
   if (!value) {
     return fallback;
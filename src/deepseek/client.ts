@@ -21,12 +21,22 @@ export interface DeepSeekApiClientOptions {
   fetchFn?: typeof fetch;
   enableReasonerFallback?: boolean;
   fallbackModel?: string;
+  maxRetries?: number;
+  retryBaseDelayMs?: number;
+  modelsCacheTtlMs?: number;
 }
 
 const DEFAULT_BASE_URL = "https://api.deepseek.com";
 const DEFAULT_TIMEOUT_MS = 120000;
 const DEFAULT_USER_AGENT = "deepseek-mcp-server/0.3.0";
+const DEFAULT_MAX_RETRIES = 3;
+const DEFAULT_RETRY_BASE_DELAY_MS = 250;
+const MAX_RETRY_DELAY_MS = 8000;
+const DEFAULT_MODELS_CACHE_TTL_MS = 60000;
+const SSE_DATA_PREFIX = "data:";
+const SSE_DONE_SENTINEL = "[DONE]";
 const RETRIABLE_STATUS_CODES = new Set([408, 409, 429, 500, 502, 503, 504]);
+const BETA_REQUIRED_PATTERN = /completions api is only available when using beta api/i;
 
 export class DeepSeekApiError extends Error {
   public readonly status?: number;
@@ -57,6 +67,12 @@ interface RequestOptions {
   baseUrlOverride?: string;
 }
 
+interface StreamAggregator<T> {
+  readonly chunkCount: number;
+  feed(chunk: unknown): void;
+  finalize(): T;
+}
+
 interface CompletionDeltaToolCall {
   index?: number;
   id?: string;
@@ -75,6 +91,13 @@ export class DeepSeekApiClient {
   private readonly fetchFn: typeof fetch;
   private readonly enableReasonerFallback: boolean;
   private readonly fallbackModel: string;
+  private readonly maxRetries: number;
+  private readonly retryBaseDelayMs: number;
+  private readonly modelsCacheTtlMs: number;
+  private modelsCache?: { value: DeepSeekListModelsResponse; expiresAt: number };
+  private readonly inFlightGets = new Map<string, Promise<unknown>>();
+  private readonly jsonHeaders: Readonly<Record<string, string>>;
+  private readonly sseHeaders: Readonly<Record<string, string>>;
 
   constructor(options: DeepSeekApiClientOptions) {
     this.apiKey = options.apiKey;
@@ -84,13 +107,20 @@ export class DeepSeekApiClient {
     this.fetchFn = options.fetchFn ?? fetch;
     this.enableReasonerFallback = options.enableReasonerFallback ?? true;
     this.fallbackModel = options.fallbackModel ?? "deepseek-chat";
+    this.maxRetries = options.maxRetries ?? DEFAULT_MAX_RETRIES;
+    this.retryBaseDelayMs = options.retryBaseDelayMs ?? DEFAULT_RETRY_BASE_DELAY_MS;
+    this.modelsCacheTtlMs = options.modelsCacheTtlMs ?? DEFAULT_MODELS_CACHE_TTL_MS;
+    this.jsonHeaders = buildRequestHeaders(this.apiKey, this.userAgent, "application/json");
+    this.sseHeaders = buildRequestHeaders(this.apiKey, this.userAgent, "text/event-stream");
   }
 
   async createChatCompletion(request: DeepSeekChatCompletionRequest): Promise<ChatCompletionExecutionResult> {
+    const model = String(request.model);
+
     try {
-      return await this.createChatCompletionNoFallback(request);
+      return await this.createChatCompletionNoFallback(request, model);
     } catch (error) {
-      if (!this.shouldFallback(request, error)) {
+      if (!this.shouldFallback(model, error)) {
         throw error;
       }
 
@@ -98,10 +128,10 @@ export class DeepSeekApiClient {
         ...request,
         model: this.fallbackModel,
       };
-      const fallback = await this.createChatCompletionNoFallback(fallbackRequest);
+      const fallback = await this.createChatCompletionNoFallback(fallbackRequest, this.fallbackModel);
 
       const fallbackMetadata: FallbackMetadata = {
-        fromModel: String(request.model),
+        fromModel: model,
         toModel: this.fallbackModel,
         reason: extractErrorMessage(error),
       };
@@ -115,19 +145,18 @@ export class DeepSeekApiClient {
 
   private async createChatCompletionNoFallback(
     request: DeepSeekChatCompletionRequest,
+    model: string,
   ): Promise<ChatCompletionExecutionResult> {
     if (request.stream) {
-      const chunks = await this.requestSseJson<unknown>({
-        method: "POST",
-        path: "/chat/completions",
-        body: request as Record<string, unknown>,
-        stream: true,
-      });
-
-      return {
-        response: aggregateChatCompletionChunks(chunks, String(request.model)),
-        streamChunkCount: chunks.length,
-      };
+      return this.requestStream(
+        {
+          method: "POST",
+          path: "/chat/completions",
+          body: request as Record<string, unknown>,
+          stream: true,
+        },
+        new ChatCompletionStreamAggregator(model),
+      );
     }
 
     const response = await this.requestJson<DeepSeekChatCompletionResponse>({
@@ -141,34 +170,35 @@ export class DeepSeekApiClient {
   }
 
   async createCompletion(request: DeepSeekCompletionRequest): Promise<CompletionExecutionResult> {
+    const model = String(request.model);
+
     try {
-      return await this.createCompletionInternal(request);
+      return await this.createCompletionInternal(request, model);
     } catch (error) {
       if (!this.shouldRetryCompletionOnBeta(error)) {
         throw error;
       }
 
-      return this.createCompletionInternal(request, this.buildBetaBaseUrl());
+      return this.createCompletionInternal(request, model, this.buildBetaBaseUrl());
     }
   }
 
   private async createCompletionInternal(
     request: DeepSeekCompletionRequest,
+    model: string,
     baseUrlOverride?: string,
   ): Promise<CompletionExecutionResult> {
     if (request.stream) {
-      const chunks = await this.requestSseJson<unknown>({
-        method: "POST",
-        path: "/completions",
-        body: request as Record<string, unknown>,
-        stream: true,
-        baseUrlOverride,
-      });
-
-      return {
-        response: aggregateCompletionChunks(chunks, String(request.model)),
-        streamChunkCount: chunks.length,
-      };
+      return this.requestStream(
+        {
+          method: "POST",
+          path: "/completions",
+          body: request as Record<string, unknown>,
+          stream: true,
+          baseUrlOverride,
+        },
+        new CompletionStreamAggregator(model),
+      );
     }
 
     const response = await this.requestJson<DeepSeekCompletionResponse>({
@@ -183,19 +213,22 @@ export class DeepSeekApiClient {
   }
 
   async listModels(): Promise<DeepSeekListModelsResponse> {
-    return this.requestJson<DeepSeekListModelsResponse>({
-      method: "GET",
-      path: "/models",
-      stream: false,
-    });
+    const cached = this.modelsCache;
+    if (cached && cached.expiresAt > Date.now()) {
+      return cached.value;
+    }
+
+    const models = await this.requestJsonCoalesced<DeepSeekListModelsResponse>("/models");
+
+    if (this.modelsCacheTtlMs > 0) {
+      this.modelsCache = { value: models, expiresAt: Date.now() + this.modelsCacheTtlMs };
+    }
+
+    return models;
   }
 
   async getUserBalance(): Promise<DeepSeekUserBalanceResponse> {
-    return this.requestJson<DeepSeekUserBalanceResponse>({
-      method: "GET",
-      path: "/user/balance",
-      stream: false,
-    });
+    return this.requestJsonCoalesced<DeepSeekUserBalanceResponse>("/user/balance");
   }
 
   async uploadVisionAsset(request: Record<string, unknown>): Promise<Record<string, unknown>> {
@@ -239,12 +272,11 @@ export class DeepSeekApiClient {
     });
   }
 
-  private shouldFallback(request: DeepSeekChatCompletionRequest, error: unknown): boolean {
+  private shouldFallback(sourceModel: string, error: unknown): boolean {
     if (!this.enableReasonerFallback) {
       return false;
     }
 
-    const sourceModel = String(request.model);
     if (sourceModel !== "deepseek-reasoner") {
       return false;
     }
@@ -275,6 +307,25 @@ export class DeepSeekApiClient {
     return payload as T;
   }
 
+  private requestJsonCoalesced<T>(path: string): Promise<T> {
+    // Concurrent callers of the same idempotent GET share one upstream request.
+    const existing = this.inFlightGets.get(path);
+    if (existing) {
+      return existing as Promise<T>;
+    }
+
+    const pending = this.requestJson<T>({
+      method: "GET",
+      path,
+      stream: false,
+    }).finally(() => {
+      this.inFlightGets.delete(path);
+    });
+
+    this.inFlightGets.set(path, pending);
+    return pending;
+  }
+
   private async requestJsonWithFallback<T>(options: {
     method: "GET" | "POST";
     paths: readonly string[];
@@ -317,7 +368,10 @@ export class DeepSeekApiClient {
     throw new DeepSeekApiError("No endpoint path candidates configured");
   }
 
-  private async requestSseJson<T>(options: RequestOptions): Promise<T[]> {
+  private async requestStream<T>(
+    options: RequestOptions,
+    aggregator: StreamAggregator<T>,
+  ): Promise<{ response: T; streamChunkCount: number }> {
     const response = await this.send(options);
 
     if (!response.ok) {
@@ -333,86 +387,121 @@ export class DeepSeekApiClient {
     const reader = response.body.getReader();
     const decoder = new TextDecoder();
 
-    let buffer = "";
-    const chunks: T[] = [];
+    let completed = false;
+    const parser = new SseEventParser((data) => {
+      const parsedChunk = parseSseData<unknown>(data);
+      if (parsedChunk !== undefined) {
+        aggregator.feed(parsedChunk);
+      }
+    });
+
+    try {
+      while (true) {
+        const { done, value } = await reader.read();
+        if (done) {
+          break;
+        }
+
+        parser.push(decoder.decode(value, { stream: true }));
+      }
 
-    while (true) {
-      const { done, value } = await reader.read();
-      if (done) {
-        break;
+      completed = true;
+    } finally {
+      // Cancel an abandoned stream so the pooled keep-alive socket is released
+      // instead of being held until the response is garbage collected.
+      if (!completed) {
+        await reader.cancel().catch(() => undefined);
       }
+    }
+
+    parser.push(decoder.decode());
+    parser.end();
+
+    return {
+      response: aggregator.finalize(),
+      streamChunkCount: aggregator.chunkCount,
+    };
+  }
+
+  private async send(options: RequestOptions): Promise<Response> {
+    // Serialise once; retries resend the same body string.
+    const body = options.body ? JSON.stringify(options.body) : undefined;
+
+    for (let attempt = 0; ; attempt += 1) {
+      const canRetry = attempt < this.maxRetries;
+      let response: Response;
 
-      buffer += decoder.decode(value, { stream: true }).replace(/\r\n/g, "\n");
+      try {
+        response = await this.fetchWithTimeout(options, body);
+      } catch (error) {
+        if (error instanceof DeepSeekApiError) {
+          throw error;
+        }
 
-      let splitIndex = buffer.indexOf("\n\n");
-      while (splitIndex !== -1) {
-        const eventBlock = buffer.slice(0, splitIndex).trim();
-        buffer = buffer.slice(splitIndex + 2);
+        if (error instanceof Error && error.name === "AbortError") {
+          throw new DeepSeekApiError(
+            `DeepSeek API request timed out after ${this.timeoutMs}ms`,
+            { cause: error },
+          );
+        }
 
-        const parsedChunk = parseSseEventBlock<T>(eventBlock);
-        if (parsedChunk !== undefined) {
-          chunks.push(parsedChunk);
+        if (!canRetry) {
+          throw new DeepSeekApiError("Failed to call DeepSeek API", { cause: error });
         }
 
-        splitIndex = buffer.indexOf("\n\n");
+        await wait(this.computeRetryDelayMs(attempt));
+        continue;
       }
-    }
 
-    const finalChunk = parseSseEventBlock<T>(buffer.trim());
-    if (finalChunk !== undefined) {
-      chunks.push(finalChunk);
-    }
+      if (!canRetry || !RETRIABLE_STATUS_CODES.has(response.status)) {
+        return response;
+      }
 
-    return chunks;
+      // Only the response status is retried; once a stream body is being read
+      // the caller owns it, so no partially consumed stream is ever replayed.
+      const retryAfterMs = parseRetryAfterMs(response.headers.get("retry-after"));
+      if (retryAfterMs !== undefined && retryAfterMs > MAX_RETRY_DELAY_MS) {
+        return response;
+      }
+
+      await response.body?.cancel().catch(() => undefined);
+      await wait(retryAfterMs ?? this.computeRetryDelayMs(attempt));
+    }
   }
 
-  private async send(options: RequestOptions): Promise<Response> {
+  private async fetchWithTimeout(options: RequestOptions, body: string | undefined): Promise<Response> {
     const controller = new AbortController();
     const timeoutId = setTimeout(() => controller.abort(), this.timeoutMs);
 
     try {
-      const response = await this.fetchFn(this.resolveUrl(options.path, options.baseUrlOverride), {
+      return await this.fetchFn(this.resolveUrl(options.path, options.baseUrlOverride), {
         method: options.method,
-        headers: {
-          Authorization: `Bearer ${this.apiKey}`,
-          "Content-Type": "application/json",
-          Accept: options.stream ? "text/event-stream" : "application/json",
-          "User-Agent": this.userAgent,
-        },
-        body: options.body ? JSON.stringify(options.body) : undefined,
+        headers: options.stream ? this.sseHeaders : this.jsonHeaders,
+        body,
         signal: controller.signal,
       });
-
-      return response;
-    } catch (error) {
-      if (error instanceof DeepSeekApiError) {
-        throw error;
-      }
-
-      if (error instanceof Error && error.name === "AbortError") {
-        throw new DeepSeekApiError(
-          `DeepSeek API request timed out after ${this.timeoutMs}ms`,
-          { cause: error },
-        );
-      }
-
-      throw new DeepSeekApiError("Failed to call DeepSeek API", { cause: error });
     } finally {
       clearTimeout(timeoutId);
     }
   }
 
+  private computeRetryDelayMs(attempt: number): number {
+    const backoff = Math.min(MAX_RETRY_DELAY_MS, this.retryBaseDelayMs * 2 ** attempt);
+    return Math.round(backoff * (0.5 + Math.random()));
+  }
+
   private async parseApiError(response: Response): Promise<DeepSeekApiError> {
     let payload: unknown;
 
     try {
-      payload = await response.json();
-    } catch {
+      const text = await response.text();
       try {
-        payload = await response.text();
+        payload = JSON.parse(text);
       } catch {
-        payload = undefined;
+        payload = text;
       }
+    } catch {
+      payload = undefined;
     }
 
     const message = extractErrorMessage(payload) || `DeepSeek API request failed with status ${response.status}`;
@@ -448,8 +537,7 @@ export class DeepSeekApiClient {
       return false;
     }
 
-    const message = (error.message ?? "").toLowerCase();
-    return message.includes("completions api is only available when using beta api");
+    return BETA_REQUIRED_PATTERN.test(error.message);
   }
 }
 
@@ -457,22 +545,106 @@ function normalizeBaseUrl(input: string): string {
   return input.endsWith("/") ? input.slice(0, -1) : input;
 }
 
-function parseSseEventBlock<T>(block: string): T | undefined {
-  if (!block) {
+function buildRequestHeaders(
+  apiKey: string,
+  userAgent: string,
+  accept: string,
+): Readonly<Record<string, string>> {
+  return Object.freeze({
+    Authorization: `Bearer ${apiKey}`,
+    "Content-Type": "application/json",
+    Accept: accept,
+    "User-Agent": userAgent,
+  });
+}
+
+function parseRetryAfterMs(value: string | null): number | undefined {
+  if (!value) {
     return undefined;
   }
 
-  const lines = block.split("\n");
-  const dataLines = lines
-    .filter((line) => line.startsWith("data:"))
-    .map((line) => line.slice(5).trimStart());
+  const seconds = Number(value);
+  if (Number.isFinite(seconds)) {
+    return Math.max(0, seconds * 1000);
+  }
 
-  if (dataLines.length === 0) {
+  const date = Date.parse(value);
+  if (Number.isNaN(date)) {
     return undefined;
   }
 
-  const data = dataLines.join("\n").trim();
-  if (data === "[DONE]") {
+  return Math.max(0, date - Date.now());
+}
+
+async function wait(ms: number): Promise<void> {
+  await new Promise<void>((resolve) => {
+    setTimeout(resolve, ms);
+  });
+}
+
+// Lines are scanned in place with a cursor so only `data:` payloads are sliced
+// out; only the unterminated tail is carried over between network reads.
+class SseEventParser {
+  private readonly onEvent: (data: string) => void;
+  private buffer = "";
+  private data: string | undefined;
+
+  constructor(onEvent: (data: string) => void) {
+    this.onEvent = onEvent;
+  }
+
+  push(text: string): void {
+    const buffer = this.buffer + text;
+    let lineStart = 0;
+    let newlineIndex = buffer.indexOf("\n");
+
+    while (newlineIndex !== -1) {
+      const lineEnd =
+        newlineIndex > lineStart && buffer.charCodeAt(newlineIndex - 1) === 13 ? newlineIndex - 1 : newlineIndex;
+      this.processLine(buffer, lineStart, lineEnd);
+
+      lineStart = newlineIndex + 1;
+      newlineIndex = buffer.indexOf("\n", lineStart);
+    }
+
+    this.buffer = lineStart === 0 ? buffer : buffer.slice(lineStart);
+  }
+
+  end(): void {
+    if (this.buffer) {
+      const buffer = this.buffer;
+      this.buffer = "";
+      this.processLine(buffer, 0, buffer.length);
+    }
+
+    this.dispatch();
+  }
+
+  private processLine(buffer: string, start: number, end: number): void {
+    if (start === end) {
+      this.dispatch();
+      return;
+    }
+
+    if (buffer.startsWith(SSE_DATA_PREFIX, start)) {
+      const line = buffer.slice(start + SSE_DATA_PREFIX.length, end).trimStart();
+      this.data = this.data === undefined ? line : `${this.data}\n${line}`;
+    }
+  }
+
+  private dispatch(): void {
+    if (this.data === undefined) {
+      return;
+    }
+
+    const data = this.data.trim();
+    this.data = undefined;
+    this.onEvent(data);
+  }
+}
+
+function parseSseData<T>(data: string): T | undefined {
+  if (!data || data === SSE_DONE_SENTINEL) {
     return undefined;
   }
 
@@ -486,45 +658,53 @@ function parseSseEventBlock<T>(block: string): T | undefined {
   }
 }
 
-function aggregateChatCompletionChunks(chunks: unknown[], requestedModel: string): DeepSeekChatCompletionResponse {
-  let id = "";
-  let model = requestedModel;
-  let created = Math.floor(Date.now() / 1000);
-  let finishReason: string | null = null;
-  let content = "";
-  let reasoningContent = "";
-  let usage: DeepSeekUsage | undefined;
-  const toolCalls: DeepSeekToolCall[] = [];
-
-  for (const chunk of chunks) {
+class ChatCompletionStreamAggregator implements StreamAggregator<DeepSeekChatCompletionResponse> {
+  public chunkCount = 0;
+  private id = "";
+  private model: string;
+  private created = Math.floor(Date.now() / 1000);
+  private finishReason: string | null = null;
+  // V8 appends to strings as ropes, so `+=` per delta is amortised O(1) and is
+  // only flattened once when the final response is serialised.
+  private content = "";
+  private reasoningContent = "";
+  private usage: DeepSeekUsage | undefined;
+  private readonly toolCalls: DeepSeekToolCall[] = [];
+
+  constructor(requestedModel: string) {
+    this.model = requestedModel;
+  }
+
+  feed(chunk: unknown): void {
+    this.chunkCount += 1;
+
     if (!isObject(chunk)) {
-      continue;
+      return;
     }
 
     if (typeof chunk.id === "string") {
-      id = chunk.id;
+      this.id = chunk.id;
     }
 
     if (typeof chunk.model === "string") {
-      model = chunk.model;
+      this.model = chunk.model;
     }
 
     if (typeof chunk.created === "number") {
-      created = chunk.created;
+      this.created = chunk.created;
     }
 
     if (isObject(chunk.usage)) {
-      usage = chunk.usage as DeepSeekUsage;
+      this.usage = chunk.usage as DeepSeekUsage;
     }
 
-    const choices = Array.isArray(chunk.choices) ? chunk.choices : [];
-    const choice = choices[0];
+    const choice = Array.isArray(chunk.choices) ? chunk.choices[0] : undefined;
     if (!isObject(choice)) {
-      continue;
+      return;
     }
 
     if (typeof choice.finish_reason === "string") {
-      finishReason = choice.finish_reason;
+      this.finishReason = choice.finish_reason;
     }
 
     const delta = isObject(choice.delta)
@@ -534,47 +714,43 @@ function aggregateChatCompletionChunks(chunks: unknown[], requestedModel: string
         : undefined;
 
     if (!delta) {
-      continue;
+      return;
     }
 
     if (typeof delta.content === "string") {
-      content += delta.content;
+      this.content += delta.content;
     }
 
     if (typeof delta.reasoning_content === "string") {
-      reasoningContent += delta.reasoning_content;
-    }
-
-    const deltaToolCalls = Array.isArray(delta.tool_calls)
-      ? (delta.tool_calls as CompletionDeltaToolCall[])
-      : [];
-
-    mergeDeltaToolCalls(toolCalls, deltaToolCalls);
-  }
-
-  if (!id) {
-    id = `chatcmpl-${Date.now()}`;
-  }
-
-  return {
-    id,
-    object: "chat.completion",
-    created,
-    model,
-    choices: [
-      {
-        index: 0,
-        finish_reason: finishReason,
-        message: {
-          role: "assistant",
-          content: content || null,
-          ...(reasoningContent ? { reasoning_content: reasoningContent } : {}),
-          ...(toolCalls.length > 0 ? { tool_calls: toolCalls } : {}),
+      this.reasoningContent += delta.reasoning_content;
+    }
+
+    if (Array.isArray(delta.tool_calls)) {
+      mergeDeltaToolCalls(this.toolCalls, delta.tool_calls as CompletionDeltaToolCall[]);
+    }
+  }
+
+  finalize(): DeepSeekChatCompletionResponse {
+    return {
+      id: this.id || `chatcmpl-${Date.now()}`,
+      object: "chat.completion",
+      created: this.created,
+      model: this.model,
+      choices: [
+        {
+          index: 0,
+          finish_reason: this.finishReason,
+          message: {
+            role: "assistant",
+            content: this.content || null,
+            ...(this.reasoningContent ? { reasoning_content: this.reasoningContent } : {}),
+            ...(this.toolCalls.length > 0 ? { tool_calls: this.toolCalls } : {}),
+          },
         },
-      },
-    ],
-    ...(usage ? { usage } : {}),
-  };
+      ],
+      ...(this.usage ? { usage: this.usage } : {}),
+    };
+  }
 }
 
 function mergeDeltaToolCalls(target: DeepSeekToolCall[], deltaCalls: CompletionDeltaToolCall[]): void {
@@ -609,67 +785,72 @@ function mergeDeltaToolCalls(target: DeepSeekToolCall[], deltaCalls: CompletionD
   }
 }
 
-function aggregateCompletionChunks(chunks: unknown[], requestedModel: string): DeepSeekCompletionResponse {
-  let id = "";
-  let model = requestedModel;
-  let created = Math.floor(Date.now() / 1000);
-  let finishReason: string | null = null;
-  let text = "";
-  let usage: DeepSeekUsage | undefined;
+class CompletionStreamAggregator implements StreamAggregator<DeepSeekCompletionResponse> {
+  public chunkCount = 0;
+  private id = "";
+  private model: string;
+  private created = Math.floor(Date.now() / 1000);
+  private finishReason: string | null = null;
+  private text = "";
+  private usage: DeepSeekUsage | undefined;
+
+  constructor(requestedModel: string) {
+    this.model = requestedModel;
+  }
+
+  feed(chunk: unknown): void {
+    this.chunkCount += 1;
 
-  for (const chunk of chunks) {
     if (!isObject(chunk)) {
-      continue;
+      return;
     }
 
     if (typeof chunk.id === "string") {
-      id = chunk.id;
+      this.id = chunk.id;
     }
 
     if (typeof chunk.model === "string") {
-      model = chunk.model;
+      this.model = chunk.model;
     }
 
     if (typeof chunk.created === "number") {
-      created = chunk.created;
+      this.created = chunk.created;
     }
 
     if (isObject(chunk.usage)) {
-      usage = chunk.usage as DeepSeekUsage;
+      this.usage = chunk.usage as DeepSeekUsage;
     }
 
     const choice = Array.isArray(chunk.choices) ? chunk.choices[0] : undefined;
     if (!isObject(choice)) {
-      continue;
+      return;
     }
 
     if (typeof choice.text === "string") {
-      text += choice.text;
+      this.text += choice.text;
     }
 
     if (typeof choice.finish_reason === "string") {
-      finishReason = choice.finish_reason;
+      this.finishReason = choice.finish_reason;
     }
   }
 
-  if (!id) {
-    id = `cmpl-${Date.now()}`;
+  finalize(): DeepSeekCompletionResponse {
+    return {
+      id: this.id || `cmpl-${Date.now()}`,
+      object: "text_completion",
+      created: this.created,
+      model: this.model,
+      choices: [
+        {
+          index: 0,
+          text: this.text,
+          finish_reason: this.finishReason,
+        },
+      ],
+      ...(this.usage ? { usage: this.usage } : {}),
+    };
   }
-
-  return {
-    id,
-    object: "text_completion",
-    created,
-    model,
-    choices: [
-      {
-        index: 0,
-        text,
-        finish_reason: finishReason,
-      },
-    ],
-    ...(usage ? { usage } : {}),
-  };
 }
 
 function isObject(value: unknown): value is Record<string, unknown> {
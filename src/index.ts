@@ -18,6 +18,8 @@ async function main(): Promise<void> {
     apiKey: config.deepseekApiKey,
     baseUrl: config.deepseekBaseUrl,
     timeoutMs: config.deepseekRequestTimeoutMs,
+    maxRetries: config.deepseekMaxRetries,
+    modelsCacheTtlMs: config.deepseekModelsCacheTtlMs,
     enableReasonerFallback: config.enableReasonerFallback,
     fallbackModel: config.fallbackModel,
   });
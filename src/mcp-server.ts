@@ -279,8 +279,12 @@ function registerTools(server: McpServer, options: DeepSeekMcpServerOptions): vo
         }
 
         const newMessages = normalizeInputMessages(normalizedInput);
-        const existingHistory = conversationId ? options.conversations.get(conversationId) : [];
-        const outboundMessages = conversationId ? [...existingHistory, ...newMessages] : newMessages;
+        let outboundMessages = newMessages;
+        if (conversationId) {
+          // get() hands back a private copy, so the new turn is appended in place.
+          outboundMessages = options.conversations.get(conversationId);
+          outboundMessages.push(...newMessages);
+        }
 
         const request = buildChatCompletionRequest(normalizedInput, outboundMessages, options.defaultModel);
         const result = await options.client.createChatCompletion(request);
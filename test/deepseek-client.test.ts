@@ -72,6 +72,10 @@ describe("DeepSeekApiClient", () => {
     const [url, init] = fetchMock.mock.calls[0] as [string, RequestInit];
     expect(url).toBe("https://api.deepseek.com/chat/completions");
     expect(init.method).toBe("POST");
+    expect(init.headers).toMatchObject({
+      Authorization: "Bearer test-key",
+      Accept: "application/json",
+    });
 
     const body = JSON.parse(String(init.body));
     expect(body.model).toBe("deepseek-chat");
@@ -164,6 +168,86 @@ describe("DeepSeekApiClient", () => {
     expect(result.response.choices[0]?.finish_reason).toBe("tool_calls");
   });
 
+  it("parses SSE events split across reads with CRLF line endings and comments", async () => {
+    const pieces = [
+      ": keep-alive\r\n\r\n",
+      'data: {"id":"chat-split","choices":[{"index":0,"delta":{"content":"Hel',
+      'lo"},"finish_reason":null}]}\r',
+      "\n\r\ndata: ",
+      '{"id":"chat-split","choices":[{"index":0,"delta":{"content":" there"},"finish_reason":"stop"}]}\r\n\r\n',
+      "data: [DONE]\r\n\r\n",
+    ];
+    const encoder = new TextEncoder();
+    const stream = new ReadableStream<Uint8Array>({
+      start(controller) {
+        for (const piece of pieces) {
+          controller.enqueue(encoder.encode(piece));
+        }
+
+        controller.close();
+      },
+    });
+
+    const fetchMock = vi.fn<typeof fetch>().mockResolvedValue(
+      new Response(stream, {
+        status: 200,
+        headers: {
+          "content-type": "text/event-stream",
+        },
+      }),
+    );
+
+    const client = new DeepSeekApiClient({
+      apiKey: "test-key",
+      fetchFn: fetchMock,
+    });
+
+    const result = await client.createChatCompletion({
+      model: "deepseek-chat",
+      stream: true,
+      messages: [{ role: "user", content: "hi" }],
+    });
+
+    expect(result.streamChunkCount).toBe(2);
+    expect(result.response.id).toBe("chat-split");
+    expect(result.response.choices[0]?.message.content).toBe("Hello there");
+    expect(result.response.choices[0]?.finish_reason).toBe("stop");
+  });
+
+  it("cancels the stream body when a chunk cannot be parsed", async () => {
+    const cancel = vi.fn();
+    const stream = new ReadableStream<Uint8Array>({
+      start(controller) {
+        controller.enqueue(new TextEncoder().encode("data: {not-json\n\n"));
+      },
+      cancel,
+    });
+
+    const fetchMock = vi.fn<typeof fetch>().mockResolvedValue(
+      new Response(stream, {
+        status: 200,
+        headers: {
+          "content-type": "text/event-stream",
+        },
+      }),
+    );
+
+    const client = new DeepSeekApiClient({
+      apiKey: "test-key",
+      fetchFn: fetchMock,
+    });
+
+    await expect(
+      client.createChatCompletion({
+        model: "deepseek-chat",
+        stream: true,
+        messages: [{ role: "user", content: "hi" }],
+      }),
+    ).rejects.toBeInstanceOf(DeepSeekApiError);
+
+    expect(cancel).toHaveBeenCalledTimes(1);
+  });
+
   it("falls back from deepseek-reasoner to deepseek-chat on retriable failures", async () => {
     const fetchMock = vi
       .fn<typeof fetch>()
@@ -201,6 +285,7 @@ describe("DeepSeekApiClient", () => {
       fetchFn: fetchMock,
       enableReasonerFallback: true,
       fallbackModel: "deepseek-chat",
+      maxRetries: 0,
     });
 
     const result = await client.createChatCompletion({
@@ -222,6 +307,55 @@ describe("DeepSeekApiClient", () => {
     expect(result.response.choices[0]?.message.content).toBe("fallback answer");
   });
 
+  it("retries retriable statuses with backoff before returning", async () => {
+    const fetchMock = vi
+      .fn<typeof fetch>()
+      .mockResolvedValueOnce(
+        new Response(JSON.stringify({ error: { message: "rate limited" } }), {
+          status: 429,
+          headers: {
+            "content-type": "application/json",
+            "retry-after": "0",
+          },
+        }),
+      )
+      .mockRejectedValueOnce(new TypeError("fetch failed"))
+      .mockResolvedValueOnce(jsonResponse({ error: { message: "overloaded" } }, 503))
+      .mockResolvedValueOnce(jsonResponse({ object: "list", data: [{ id: "deepseek-chat", object: "model" }] }));
+
+    const client = new DeepSeekApiClient({
+      apiKey: "test-key",
+      fetchFn: fetchMock,
+      maxRetries: 3,
+      retryBaseDelayMs: 1,
+    });
+
+    const models = await client.listModels();
+
+    expect(models.data[0]?.id).toBe("deepseek-chat");
+    expect(fetchMock).toHaveBeenCalledTimes(4);
+  });
+
+  it("surfaces the last retriable failure once retries are exhausted", async () => {
+    const fetchMock = vi
+      .fn<typeof fetch>()
+      .mockImplementation(async () => jsonResponse({ error: { message: "overloaded" } }, 503));
+
+    const client = new DeepSeekApiClient({
+      apiKey: "test-key",
+      fetchFn: fetchMock,
+      maxRetries: 1,
+      retryBaseDelayMs: 1,
+    });
+
+    const error = await client.getUserBalance().catch((caught: unknown) => caught);
+
+    expect(error).toBeInstanceOf(DeepSeekApiError);
+    expect((error as DeepSeekApiError).status).toBe(503);
+    expect((error as DeepSeekApiError).message).toBe("overloaded");
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+  });
+
   it("does not fallback on non-retriable API errors", async () => {
     const fetchMock = vi.fn<typeof fetch>().mockResolvedValue(
       jsonResponse(
@@ -250,6 +384,29 @@ describe("DeepSeekApiClient", () => {
     expect(fetchMock).toHaveBeenCalledTimes(1);
   });
 
+  it("keeps non-JSON error bodies as the error message", async () => {
+    const fetchMock = vi.fn<typeof fetch>().mockResolvedValue(
+      new Response("upstream gateway timeout", {
+        status: 400,
+        headers: {
+          "content-type": "text/plain",
+        },
+      }),
+    );
+
+    const client = new DeepSeekApiClient({
+      apiKey: "test-key",
+      fetchFn: fetchMock,
+    });
+
+    const error = await client.listModels().catch((caught: unknown) => caught);
+
+    expect(error).toBeInstanceOf(DeepSeekApiError);
+    expect((error as DeepSeekApiError).status).toBe(400);
+    expect((error as DeepSeekApiError).message).toBe("upstream gateway timeout");
+    expect((error as DeepSeekApiError).payload).toBe("upstream gateway timeout");
+  });
+
   it("supports streaming /completions aggregation", async () => {
     const fetchMock = vi.fn<typeof fetch>().mockResolvedValue(
       sseResponse([
@@ -376,6 +533,97 @@ describe("DeepSeekApiClient", () => {
     expect(secondUrl).toBe("https://api.deepseek.com/user/balance");
   });
 
+  it("caches /models responses until the TTL expires", async () => {
+    const fetchMock = vi
+      .fn<typeof fetch>()
+      .mockImplementation(async () => jsonResponse({ object: "list", data: [{ id: "deepseek-chat", object: "model" }] }));
+
+    const cachedClient = new DeepSeekApiClient({
+      apiKey: "test-key",
+      fetchFn: fetchMock,
+    });
+
+    await cachedClient.listModels();
+    const models = await cachedClient.listModels();
+
+    expect(models.data[0]?.id).toBe("deepseek-chat");
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+
+    const uncachedClient = new DeepSeekApiClient({
+      apiKey: "test-key",
+      fetchFn: fetchMock,
+      modelsCacheTtlMs: 0,
+    });
+
+    await uncachedClient.listModels();
+    await uncachedClient.listModels();
+
+    expect(fetchMock).toHaveBeenCalledTimes(3);
+  });
+
+  it("coalesces concurrent identical GET requests into one upstream call", async () => {
+    const pending: Array<(response: Response) => void> = [];
+    const fetchMock = vi.fn<typeof fetch>().mockImplementation(
+      () => new Promise<Response>((resolve) => pending.push(resolve)),
+    );
+
+    const client = new DeepSeekApiClient({
+      apiKey: "test-key",
+      fetchFn: fetchMock,
+    });
+
+    const first = client.getUserBalance();
+    const second = client.getUserBalance();
+
+    await vi.waitFor(() => expect(pending).toHaveLength(1));
+    pending[0]?.(jsonResponse({ is_available: true, balance_infos: [] }));
+
+    expect((await first).is_available).toBe(true);
+    expect((await second).is_available).toBe(true);
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+
+    const third = client.getUserBalance();
+    await vi.waitFor(() => expect(pending).toHaveLength(2));
+    pending[1]?.(jsonResponse({ is_available: false, balance_infos: [] }));
+
+    expect((await third).is_available).toBe(false);
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+  });
+
+  it("issues concurrent requests without waiting on each other", async () => {
+    const pending: Array<(response: Response) => void> = [];
+    const fetchMock = vi.fn<typeof fetch>().mockImplementation(
+      () => new Promise<Response>((resolve) => pending.push(resolve)),
+    );
+
+    const client = new DeepSeekApiClient({
+      apiKey: "test-key",
+      fetchFn: fetchMock,
+    });
+
+    const chat = client.createChatCompletion({
+      model: "deepseek-chat",
+      messages: [{ role: "user", content: "hi" }],
+    });
+    const models = client.listModels();
+
+    await vi.waitFor(() => expect(fetchMock).toHaveBeenCalledTimes(2));
+
+    pending[1]?.(jsonResponse({ object: "list", data: [{ id: "deepseek-chat", object: "model" }] }));
+    pending[0]?.(
+      jsonResponse({
+        id: "chat-3",
+        object: "chat.completion",
+        created: 3,
+        model: "deepseek-chat",
+        choices: [{ index: 0, finish_reason: "stop", message: { role: "assistant", content: "ok" } }],
+      }),
+    );
+
+    expect((await models).data[0]?.id).toBe("deepseek-chat");
+    expect((await chat).response.choices[0]?.message.content).toBe("ok");
+  });
+
   it("calls speculative v4 endpoints through typed client methods", async () => {
     const fetchMock = vi
       .fn<typeof fetch>()